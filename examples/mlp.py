@@ -46,7 +46,7 @@ def load_data():
     )
 
 
-def train_one(hidden_size, lr, dropout, num_epochs):
+def train_one(data, hidden_size, lr, dropout, num_epochs):
     run = goodseed.Run(name="synth-mlp", project="examples")
 
     run.log_configs({
@@ -57,34 +57,46 @@ def train_one(hidden_size, lr, dropout, num_epochs):
         "dataset": "make_classification-20k",
     })
 
-    X_train, X_test, y_train, y_test = load_data()
+    X_train, X_test, y_train, y_test = data
     model = MLP(40, hidden_size, 10, dropout)
+    if hasattr(torch, "compile"):
+        try:
+            model = torch.compile(model)
+        except Exception:
+            pass  # no compiler toolchain available; eager mode works fine
     criterion = nn.CrossEntropyLoss()
     optimizer = optim.Adam(model.parameters(), lr=lr)
 
     batch_step = 0
     for epoch in range(num_epochs):
         model.train()
+        # Shuffle once per epoch; contiguous slices below are views,
+        # unlike per-batch fancy indexing which copies every batch.
         idx = torch.randperm(len(X_train))
-        total_loss, correct, total, n = 0.0, 0, 0, 0
-
-        for i in range(0, len(X_train), 64):
-            bi = idx[i:i+64]
-            out = model(X_train[bi])
-            loss = criterion(out, y_train[bi])
+        Xp, yp = X_train[idx], y_train[idx]
+        # Accumulate on-device; .item() forces a sync, so do it once per
+        # epoch rather than once per batch.
+        total_loss = torch.zeros(())
+        correct = torch.zeros((), dtype=torch.long)
+        total, n = 0, 0
+
+        for i in range(0, len(Xp), 64):
+            xb, yb = Xp[i:i+64], yp[i:i+64]
+            out = model(xb)
+            loss = criterion(out, yb)
             optimizer.zero_grad()
             loss.backward()
             optimizer.step()
-            total_loss += loss.item()
-            correct += (out.argmax(1) == y_train[bi]).sum().item()
-            total += len(bi)
+            total_loss += loss.detach()
+            correct += (out.argmax(1) == yb).sum()
+            total += len(xb)
             n += 1
             batch_step += 1
             if batch_step % 10 == 0:
                 run.log_metrics({"train/batch_loss": loss.item()}, step=batch_step)
 
-        train_loss = total_loss / n
-        train_acc = correct / total
+        train_loss = total_loss.item() / n
+        train_acc = correct.item() / total
         run.log_metrics({"train/loss": train_loss, "train/accuracy": train_acc}, step=epoch + 1)
 
         if (epoch + 1) % 5 == 0:
@@ -113,10 +125,11 @@ def main():
         (256, 0.003, 0.3, 200),
     ]
     print(f"Running {len(configs)} experiments...\n")
+    data = load_data()  # deterministic split, shared by all experiments
     results = []
     for i, (h, lr, drop, ep) in enumerate(configs, 1):
         print(f"[{i}/{len(configs)}] hidden={h}, lr={lr}, dropout={drop}")
-        acc = train_one(h, lr, drop, ep)
+        acc = train_one(data, h, lr, drop, ep)
         results.append((h, lr, drop, acc))
 
     print("\n--- Summary ---")
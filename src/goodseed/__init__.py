@@ -8,14 +8,17 @@ Example:
     >>> run.close()
 """
 
-from goodseed.run import GitRef, Run, Storage
-from goodseed.projects import (
-    ensure_project,
-    list_projects,
-    list_runs,
-    list_workspaces,
-    me,
-)
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from goodseed.projects import (
+        ensure_project,
+        list_projects,
+        list_runs,
+        list_workspaces,
+        me,
+    )
+    from goodseed.run import GitRef, Run, Storage
 
 __version__ = "0.4.0"
 __all__ = [
@@ -28,3 +31,19 @@ __all__ = [
     "list_runs",
     "me",
 ]
+
+_RUN_EXPORTS = {"Run", "GitRef", "Storage"}
+
+
+def __getattr__(name: str):
+    # Lazy imports keep `import goodseed` cheap; goodseed.run drags in
+    # storage, sync, and monitoring, which only Run users need.
+    if name in _RUN_EXPORTS:
+        import goodseed.run as _run
+
+        return getattr(_run, name)
+    if name in __all__:
+        import goodseed.projects as _projects
+
+        return getattr(_projects, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
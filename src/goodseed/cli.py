@@ -14,12 +14,16 @@ import sys
 from pathlib import Path
 
 from goodseed.config import get_api_key, get_projects_dir, get_run_db_path
-from goodseed.server import _scan_projects, _scan_runs, run_server
-from goodseed.sync import upload_run
+
+# goodseed.server and goodseed.sync are imported inside the command
+# functions: they pull in http.server / sqlite3 / urllib, which would
+# otherwise slow down startup for every subcommand.
 
 
 def cmd_serve(args: argparse.Namespace) -> int:
     """Start the local HTTP server."""
+    from goodseed.server import run_server
+
     projects_dir = Path(args.dir) if args.dir else get_projects_dir()
     run_server(projects_dir, port=args.port, verbose=args.verbose)
     return 0
@@ -33,6 +37,8 @@ def cmd_list(args: argparse.Namespace) -> int:
         print(f"Projects directory does not exist: {projects_dir}")
         return 0
 
+    from goodseed.server import _scan_projects, _scan_runs
+
     if args.project:
         # List runs for a specific project
         runs = _scan_runs(projects_dir)
@@ -76,6 +82,8 @@ def cmd_list(args: argparse.Namespace) -> int:
 
 def cmd_upload(args: argparse.Namespace) -> int:
     """Upload unuploaded data from a run's local database."""
+    from goodseed.sync import upload_run
+
     project = args.project
     api_key = args.api_key or get_api_key()
     if not api_key:
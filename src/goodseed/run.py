@@ -14,6 +14,7 @@ import shutil
 import subprocess
 import sys
 import threading
+import time
 import warnings
 from datetime import datetime, timezone
 from pathlib import Path
@@ -45,6 +46,18 @@ import re
 
 Number = Union[int, float]
 
+# Metric points are buffered in memory and flushed to SQLite in batches so
+# that high-frequency logging does not pay one transaction (and WAL fsync)
+# per call. A flush happens when the buffer reaches _FLUSH_MAX_POINTS or
+# after _FLUSH_INTERVAL seconds, whichever comes first.
+_FLUSH_MAX_POINTS = 512
+_FLUSH_INTERVAL = 0.25
+# Hard cap on buffered points: above this, the logging call flushes
+# inline instead of letting the buffer grow without bound.
+_FLUSH_HARD_CAP = 10_000
+# Run a passive WAL checkpoint after this many flushed points.
+_CHECKPOINT_EVERY_POINTS = 1000
+
 _MAX_RUN_ID_LEN = 128
 _MAX_EXPERIMENT_NAME_LEN = 200
 _RUN_ID_RE = re.compile(r'^[a-zA-Z0-9]([a-zA-Z0-9_-]*[a-zA-Z0-9])?$')
@@ -490,6 +503,15 @@ class Run:
         self._closed = False
         self._auto_step: dict[str, float] = {}  # per-path auto-increment counters
 
+        # Write buffers (see _flush_loop). Initialized for all storage
+        # modes so close() and reads can flush unconditionally.
+        self._pending_metrics: list[tuple[str, Number, float, int]] = []
+        self._pending_strings: list[tuple[str, Number, str, int]] = []
+        self._points_since_checkpoint = 0
+        self._flush_event = threading.Event()
+        self._flush_stop = threading.Event()
+        self._flush_thread: threading.Thread | None = None
+
         if storage is None:
             storage = os.environ.get(ENV_STORAGE, Storage.CLOUD)
         self._storage_mode = Storage(storage)
@@ -530,6 +552,11 @@ class Run:
         if self._storage_mode == Storage.CLOUD:
             self._init_remote_sync(api_key)
 
+        self._flush_thread = threading.Thread(
+            target=self._flush_loop, name="goodseed-flush", daemon=True
+        )
+        self._flush_thread.start()
+
         self._init_monitoring(
             capture_hardware_metrics, capture_stdout,
             capture_stderr, capture_traceback, monitoring_namespace,
@@ -784,6 +811,108 @@ class Run:
         )
         self._monitoring.start()
 
+    def _flush_loop(self) -> None:
+        """Background thread: flush buffered metric points periodically.
+
+        Wakes when a buffer fills past _FLUSH_MAX_POINTS (signalled via
+        _flush_event) or after _FLUSH_INTERVAL seconds, and writes the
+        accumulated points in a single transaction. The flush thread is
+        the only thread that touches SQLite on the hot path, so user
+        threads never contend on the database itself.
+        """
+        while not self._flush_stop.is_set():
+            self._flush_event.wait(_FLUSH_INTERVAL)
+            self._flush_event.clear()
+            self._flush_metrics()
+
+    def _flush_metrics(self) -> None:
+        """Write all buffered metric and string points to storage."""
+        with self._lock:
+            if self._storage is None:
+                return
+            batch = self._pending_metrics
+            strings = self._pending_strings
+            if not batch and not strings:
+                return
+            self._pending_metrics = []
+            self._pending_strings = []
+        try:
+            try:
+                if batch:
+                    self._storage.log_metric_points(batch)
+                if strings:
+                    self._storage.log_string_points(strings)
+            except Exception:
+                # A single unwritable value (e.g. NaN, which sqlite3 binds
+                # as NULL) fails the whole batched insert. Retry point by
+                # point so only the offenders are dropped, not every point
+                # that happened to share the buffer with them.
+                self._flush_pointwise(batch, strings)
+            # Throttled passive checkpoint keeps the WAL from bloating
+            # during long runs without ever blocking on readers.
+            self._points_since_checkpoint += len(batch) + len(strings)
+            if self._points_since_checkpoint >= _CHECKPOINT_EVERY_POINTS:
+                self._points_since_checkpoint = 0
+                self._storage.checkpoint_passive()
+        except Exception:
+            # Never let a failed flush kill the background thread; points
+            # are dropped but the run itself keeps going.
+            import logging
+            logging.getLogger("goodseed.run").warning(
+                "Failed to flush %d buffered point(s)",
+                len(batch) + len(strings), exc_info=True,
+            )
+
+    def _flush_pointwise(
+        self,
+        batch: list[tuple[str, Number, float, int]],
+        strings: list[tuple[str, Number, str, int]],
+    ) -> None:
+        """Fallback for a failed batched flush: insert one point at a time."""
+        import logging
+        logger = logging.getLogger("goodseed.run")
+        for point in batch:
+            try:
+                self._storage.log_metric_points([point])
+            except Exception:
+                logger.warning("Dropping unwritable metric point %r", point)
+        for point in strings:
+            try:
+                self._storage.log_string_points([point])
+            except Exception:
+                logger.warning("Dropping unwritable string point %r", point)
+
+    def _buffer_metric_points(
+        self, points: list[tuple[str, Number, float, int]]
+    ) -> None:
+        """Append points to the write buffer. Must hold ``self._lock``."""
+        self._pending_metrics.extend(points)
+        if len(self._pending_metrics) >= _FLUSH_MAX_POINTS:
+            self._flush_event.set()
+        if len(self._pending_metrics) >= _FLUSH_HARD_CAP:
+            # Backpressure: the flush thread is not keeping up, so this
+            # logging call absorbs the write cost itself.
+            self._flush_metrics()
+
+    def _buffer_string_points(
+        self, points: list[tuple[str, Number, str, int]]
+    ) -> None:
+        """Append string points to the write buffer. Must hold ``self._lock``."""
+        self._pending_strings.extend(points)
+        if len(self._pending_strings) >= _FLUSH_MAX_POINTS:
+            self._flush_event.set()
+        if len(self._pending_strings) >= _FLUSH_HARD_CAP:
+            self._flush_metrics()
+
+    def _stop_flush_thread(self) -> None:
+        """Stop the flush thread and write any remaining buffered points."""
+        if self._flush_thread is not None:
+            self._flush_stop.set()
+            self._flush_event.set()
+            self._flush_thread.join()
+            self._flush_thread = None
+        self._flush_metrics()
+
     def _log_strings_internal(
         self, data: dict[str, str], step: int
     ) -> None:
@@ -791,12 +920,12 @@ class Run:
         with self._lock:
             if self._closed or self._storage is None:
                 return
-            ts = int(datetime.now(timezone.utc).timestamp())
+            ts = int(time.time())
             points = []
             for k, v in data.items():
                 path = normalize_path(k)
                 points.append((path, step, str(v), ts))
-            self._storage.log_string_points(points)
+            self._buffer_string_points(points)
 
     def _log_metrics_internal(
         self, data: dict[str, float], step: int
@@ -805,12 +934,12 @@ class Run:
         with self._lock:
             if self._closed or self._storage is None:
                 return
-            ts = int(datetime.now(timezone.utc).timestamp())
+            ts = int(time.time())
             points = []
             for k, v in data.items():
                 path = normalize_path(k)
                 points.append((path, step, float(v), ts))
-            self._storage.log_metric_points(points)
+            self._buffer_metric_points(points)
 
     def log_configs(
         self,
@@ -963,6 +1092,7 @@ class Run:
         """
         if self._storage is None:
             raise RuntimeError("Run has no local storage")
+        self._flush_metrics()
         return self._storage.field_exists(normalize_path(path))
 
     def _fetch_field(self, path: str) -> Any:
@@ -976,6 +1106,7 @@ class Run:
         if self._storage is None:
             raise RuntimeError("Run has no local storage")
 
+        self._flush_metrics()
         normed = normalize_path(path)
 
         # Check configs first
@@ -1035,7 +1166,7 @@ class Run:
             if self._closed:
                 raise RuntimeError("Run is closed")
 
-            ts = int(datetime.now(timezone.utc).timestamp())
+            ts = int(time.time())
 
             points = []
             for k, v in data.items():
@@ -1043,7 +1174,7 @@ class Run:
                 s = self._resolve_step(path, step)
                 points.append((path, s, float(v), ts))
 
-            self._storage.log_metric_points(points)
+            self._buffer_metric_points(points)
 
     def log_strings(
         self,
@@ -1065,7 +1196,7 @@ class Run:
             if self._closed:
                 raise RuntimeError("Run is closed")
 
-            ts = int(datetime.now(timezone.utc).timestamp())
+            ts = int(time.time())
 
             points = []
             for k, v in data.items():
@@ -1073,7 +1204,7 @@ class Run:
                 s = self._resolve_step(path, step)
                 points.append((path, s, str(v), ts))
 
-            self._storage.log_string_points(points)
+            self._buffer_string_points(points)
 
     def log_string_series(
         self,
@@ -1218,6 +1349,8 @@ class Run:
         if self._monitoring is not None:
             self._monitoring.close()
 
+        self._stop_flush_thread()
+
         self._storage.set_meta("status", status)
         self._storage.set_meta("closed_at", datetime.now(timezone.utc).isoformat())
         now = datetime.now(timezone.utc).isoformat()
@@ -1251,15 +1384,19 @@ class Run:
 
         self._storage.checkpoint_wal()
         self._storage.close()
+        # Drop the atexit hook so a closed Run can be garbage-collected;
+        # otherwise the interpreter keeps every run alive until exit.
+        atexit.unregister(self._cleanup)
         print(f"Goodseed run closed: {self.run_id}")
 
     def sync(self) -> None:
         """Request an immediate sync cycle (non-blocking).
 
-        Data is always persisted to local SQLite immediately. This method
-        triggers the background sync process to upload to the remote API
-        without waiting for the next scheduled interval.
+        Flushes buffered points to local SQLite, then triggers the
+        background sync process to upload to the remote API without
+        waiting for the next scheduled interval.
         """
+        self._flush_metrics()
         if self._sync_process is not None:
             self._sync_process.sync()
 
@@ -1269,6 +1406,7 @@ class Run:
         Args:
             timeout: Maximum seconds to wait. None means wait indefinitely.
         """
+        self._flush_metrics()
         if self._sync_process is not None:
             self._sync_process.wait(timeout)
 
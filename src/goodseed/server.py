@@ -12,7 +12,8 @@ from __future__ import annotations
 import json
 import logging
 import math
-import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
 from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from pathlib import Path
@@ -24,15 +25,33 @@ from goodseed.storage import (
     downsample_metrics,
     read_configs,
     read_metrics,
+    read_metrics_json,
     read_metric_paths,
     read_run_summary,
     read_string_series,
     write_run_meta,
 )
 
+try:
+    import orjson
+except ImportError:  # optional speedup, stdlib json is the fallback
+    orjson = None
+
 logger = logging.getLogger("goodseed.server")
 
 
+def _dumps(data: Any) -> bytes:
+    """Encode *data* to UTF-8 JSON bytes, using orjson when installed.
+
+    orjson emits bytes directly and is several times faster than stdlib
+    json on large metric arrays. Inputs are pre-sanitized (no NaN/inf),
+    so both encoders produce equivalent output.
+    """
+    if orjson is not None:
+        return orjson.dumps(data)
+    return json.dumps(data).encode("utf-8")
+
+
 def _sanitize_for_json(obj: object) -> object:
     """Convert NaN/Infinity floats to strings for JSON spec compliance.
 
@@ -53,36 +72,97 @@ def _sanitize_for_json(obj: object) -> object:
     return obj
 
 
+# db_path str -> (stat signature, run record). The signature includes the
+# -wal file (when present) because under WAL mode new writes land there
+# without touching the main database file.
+_run_summary_cache: dict[str, tuple[tuple, dict[str, Any]]] = {}
+_run_summary_cache_lock = threading.Lock()
+
+# Shared pool for scanning run databases; created on first use so that
+# importing the module stays cheap.
+_scan_pool: ThreadPoolExecutor | None = None
+_scan_pool_lock = threading.Lock()
+
+
+def _get_scan_pool() -> ThreadPoolExecutor:
+    global _scan_pool
+    with _scan_pool_lock:
+        if _scan_pool is None:
+            _scan_pool = ThreadPoolExecutor(
+                max_workers=8, thread_name_prefix="goodseed-scan"
+            )
+        return _scan_pool
+
+
+def _db_stat_signature(db_path: Path) -> tuple:
+    """Build a freshness signature for a run database from file stats."""
+    st = db_path.stat()
+    sig = [st.st_mtime_ns, st.st_size]
+    wal_path = db_path.with_name(db_path.name + "-wal")
+    try:
+        wal_st = wal_path.stat()
+        # An empty WAL holds no pending frames; treat it like a missing
+        # one (merely opening a reader creates a zero-byte WAL file).
+        if wal_st.st_size > 0:
+            sig.extend((wal_st.st_mtime_ns, wal_st.st_size))
+    except OSError:
+        pass
+    return tuple(sig)
+
+
+def _read_one_run(projects_dir: Path, db_path: Path) -> dict[str, Any] | None:
+    """Read a single run record, using the summary cache when fresh."""
+    key = str(db_path)
+    try:
+        sig = _db_stat_signature(db_path)
+        with _run_summary_cache_lock:
+            cached = _run_summary_cache.get(key)
+            if cached is not None and cached[0] == sig:
+                return cached[1]
+
+        project_name = str(db_path.parent.parent.relative_to(projects_dir))
+        meta, string_series_paths, metric_paths = read_run_summary(db_path)
+        record = {
+            "project": project_name,
+            "run_id": meta.get("run_id", meta.get("run_name", db_path.stem)),
+            "experiment_name": meta.get("name", meta.get("experiment_name")),
+            "created_at": meta.get("created_at"),
+            "closed_at": meta.get("closed_at"),
+            "status": meta.get("status", "unknown"),
+            "trashed": meta.get("trashed") == "true",
+            "string_series_paths": string_series_paths,
+            "metric_paths": metric_paths,
+        }
+        with _run_summary_cache_lock:
+            _run_summary_cache[key] = (sig, record)
+        return record
+    except Exception:
+        logger.warning("Failed to read run database: %s", db_path, exc_info=True)
+        return None
+
+
 def _scan_runs(projects_dir: Path) -> list[dict[str, Any]]:
     """Scan the projects directory for run SQLite files.
 
     Supports nested project names (e.g. ``workspace/project``) by recursively
     searching for ``runs/*.sqlite`` at any depth under *projects_dir*.
+    Run summaries are cached per file and only re-read when the database
+    (or its WAL) changes on disk.
     """
-    runs = []
     if not projects_dir.exists():
-        return runs
-
-    for db_path in sorted(projects_dir.glob("**/runs/*.sqlite")):
-        project_name = str(db_path.parent.parent.relative_to(projects_dir))
-        try:
-            meta, string_series_paths, metric_paths = read_run_summary(db_path)
-
-            runs.append({
-                "project": project_name,
-                "run_id": meta.get("run_id", meta.get("run_name", db_path.stem)),
-                "experiment_name": meta.get("name", meta.get("experiment_name")),
-                "created_at": meta.get("created_at"),
-                "closed_at": meta.get("closed_at"),
-                "status": meta.get("status", "unknown"),
-                "trashed": meta.get("trashed") == "true",
-                "string_series_paths": string_series_paths,
-                "metric_paths": metric_paths,
-            })
-        except Exception:
-            logger.warning("Failed to read run database: %s", db_path, exc_info=True)
-            continue
+        return []
 
+    db_paths = sorted(projects_dir.glob("**/runs/*.sqlite"))
+    if len(db_paths) > 1:
+        # Each uncached read is an independent SQLite open + query during
+        # which the GIL is released, so stale entries scan concurrently.
+        records = _get_scan_pool().map(
+            lambda p: _read_one_run(projects_dir, p), db_paths
+        )
+    else:
+        records = (_read_one_run(projects_dir, p) for p in db_paths)
+
+    runs = [r for r in records if r is not None]
     runs.sort(key=lambda r: r.get("created_at") or "", reverse=True)
     return runs
 
@@ -118,20 +198,33 @@ def _resolve_run_db(projects_dir: Path, project: str, run_name: str) -> Path | N
     return None
 
 
-# Route patterns
-_ROUTE_PROJECTS = re.compile(r"^/api/projects$")
-_ROUTE_RUNS = re.compile(r"^/api/runs$")
-_ROUTE_CONFIGS = re.compile(r"^/api/runs/(.+)/([^/]+)/configs$")
-_ROUTE_METRICS = re.compile(r"^/api/runs/(.+)/([^/]+)/metrics$")
-_ROUTE_METRIC_PATHS = re.compile(r"^/api/runs/(.+)/([^/]+)/metric-paths$")
-_ROUTE_STRING_SERIES = re.compile(r"^/api/runs/(.+)/([^/]+)/string_series$")
-_ROUTE_TRASH_RESTORE = re.compile(r"^/api/runs/(.+)/([^/]+)/trash/restore$")
-_ROUTE_TRASH = re.compile(r"^/api/runs/(.+)/([^/]+)/trash$")
+def _parse_run_route(segments: list[str], tail_len: int) -> tuple[str, str] | None:
+    """Extract (project, run_name) from /api/runs/<project...>/<run>/<...> segments.
+
+    *tail_len* is the number of fixed trailing segments after the run name
+    (1 for e.g. /metrics, 2 for /trash/restore). Project names may contain
+    slashes (workspace/project), so everything between "runs" and the run
+    name belongs to the project.
+    """
+    project_segs = segments[2:-(tail_len + 1)]
+    if not project_segs:
+        return None
+    return "/".join(project_segs), segments[-(tail_len + 1)]
+
+
+# CORS headers sent with every response, pre-encoded once.
+_CORS_HEADER_BYTES = (
+    b"Access-Control-Allow-Origin: *\r\n"
+    b"Access-Control-Allow-Methods: GET, POST, OPTIONS\r\n"
+    b"Access-Control-Allow-Headers: Content-Type\r\n"
+)
 
 
 class _RequestHandler(BaseHTTPRequestHandler):
     """HTTP request handler for the Goodseed API."""
 
+    protocol_version = "HTTP/1.1"
+
     # Set by the server
     projects_dir: Path
 
@@ -141,23 +234,44 @@ class _RequestHandler(BaseHTTPRequestHandler):
         self._send_cors_headers()
         self.end_headers()
 
+    def _drain_body(self) -> None:
+        """Read and discard any request body.
+
+        With HTTP/1.1 keep-alive, unread body bytes would be parsed as
+        the start of the next request on the same connection.
+        """
+        length = int(self.headers.get("Content-Length", 0) or 0)
+        while length > 0:
+            chunk = self.rfile.read(min(length, 65536))
+            if not chunk:
+                break
+            length -= len(chunk)
+        if self.headers.get("Transfer-Encoding"):
+            # Chunked bodies are not parsed here; don't reuse the socket.
+            self.close_connection = True
+
     def do_GET(self) -> None:
         """Route GET requests to the appropriate handler."""
+        self._drain_body()
         parsed = urlparse(self.path)
         path = unquote(parsed.path)
         query = parse_qs(parsed.query)
 
+        segments = path.strip("/").split("/")
+
         try:
+            if segments[0] != "api" or len(segments) < 2:
+                self._send_error(404, "Not found")
+                return
+
             # GET /api/projects
-            m = _ROUTE_PROJECTS.match(path)
-            if m:
+            if segments[1] == "projects" and len(segments) == 2:
                 projects = _scan_projects(self.projects_dir)
                 self._send_json({"projects": projects})
                 return
 
             # GET /api/runs
-            m = _ROUTE_RUNS.match(path)
-            if m:
+            if segments[1] == "runs" and len(segments) == 2:
                 runs = _scan_runs(self.projects_dir)
                 project_filter = query.get("project", [None])[0]
                 if project_filter:
@@ -165,10 +279,14 @@ class _RequestHandler(BaseHTTPRequestHandler):
                 self._send_json({"runs": runs})
                 return
 
+            endpoint = segments[-1]
+            route = None
+            if segments[1] == "runs" and len(segments) >= 5:
+                route = _parse_run_route(segments, 1)
+
             # GET /api/runs/<project>/<run_name>/configs
-            m = _ROUTE_CONFIGS.match(path)
-            if m:
-                project, run_name = m.group(1), m.group(2)
+            if route and endpoint == "configs":
+                project, run_name = route
                 db_path = _resolve_run_db(self.projects_dir, project, run_name)
                 if not db_path:
                     self._send_error(404, f"Run not found: {project}/{run_name}")
@@ -178,9 +296,8 @@ class _RequestHandler(BaseHTTPRequestHandler):
                 return
 
             # GET /api/runs/<project>/<run_name>/metrics
-            m = _ROUTE_METRICS.match(path)
-            if m:
-                project, run_name = m.group(1), m.group(2)
+            if route and endpoint == "metrics":
+                project, run_name = route
                 db_path = _resolve_run_db(self.projects_dir, project, run_name)
                 if not db_path:
                     self._send_error(404, f"Run not found: {project}/{run_name}")
@@ -212,14 +329,19 @@ class _RequestHandler(BaseHTTPRequestHandler):
                     )
                     self._send_json(result)
                 else:
-                    metrics = read_metrics(db_path, metric_path)
-                    self._send_json({"metrics": metrics})
+                    # Prefer SQLite-side JSON encoding; it avoids building a
+                    # Python dict per point on the hottest endpoint.
+                    payload = read_metrics_json(db_path, metric_path)
+                    if payload is not None:
+                        self._write_response(200, b'{"metrics":' + payload + b"}")
+                    else:
+                        metrics = read_metrics(db_path, metric_path)
+                        self._send_json({"metrics": metrics})
                 return
 
             # GET /api/runs/<project>/<run_name>/metric-paths
-            m = _ROUTE_METRIC_PATHS.match(path)
-            if m:
-                project, run_name = m.group(1), m.group(2)
+            if route and endpoint == "metric-paths":
+                project, run_name = route
                 db_path = _resolve_run_db(self.projects_dir, project, run_name)
                 if not db_path:
                     self._send_error(404, f"Run not found: {project}/{run_name}")
@@ -229,9 +351,8 @@ class _RequestHandler(BaseHTTPRequestHandler):
                 return
 
             # GET /api/runs/<project>/<run_name>/string_series
-            m = _ROUTE_STRING_SERIES.match(path)
-            if m:
-                project, run_name = m.group(1), m.group(2)
+            if route and endpoint == "string_series":
+                project, run_name = route
                 db_path = _resolve_run_db(self.projects_dir, project, run_name)
                 if not db_path:
                     self._send_error(404, f"Run not found: {project}/{run_name}")
@@ -261,30 +382,31 @@ class _RequestHandler(BaseHTTPRequestHandler):
 
     def do_POST(self) -> None:
         """Route POST requests."""
+        self._drain_body()
         parsed = urlparse(self.path)
         path = unquote(parsed.path)
 
-        try:
-            # Match /restore before /trash (longer prefix first)
-            m = _ROUTE_TRASH_RESTORE.match(path)
-            if m:
-                project, run_name = m.group(1), m.group(2)
-                db_path = _resolve_run_db(self.projects_dir, project, run_name)
-                if not db_path:
-                    self._send_error(404, f"Run not found: {project}/{run_name}")
-                    return
-                write_run_meta(db_path, "trashed", None)
-                self._send_json({"ok": True})
-                return
+        segments = path.strip("/").split("/")
 
-            m = _ROUTE_TRASH.match(path)
-            if m:
-                project, run_name = m.group(1), m.group(2)
+        try:
+            route = None
+            if len(segments) >= 2 and segments[0] == "api" and segments[1] == "runs":
+                # POST /api/runs/<project>/<run_name>/trash/restore
+                if len(segments) >= 6 and segments[-2:] == ["trash", "restore"]:
+                    route = _parse_run_route(segments, 2)
+                    new_value = None
+                # POST /api/runs/<project>/<run_name>/trash
+                elif len(segments) >= 5 and segments[-1] == "trash":
+                    route = _parse_run_route(segments, 1)
+                    new_value = "true"
+
+            if route:
+                project, run_name = route
                 db_path = _resolve_run_db(self.projects_dir, project, run_name)
                 if not db_path:
                     self._send_error(404, f"Run not found: {project}/{run_name}")
                     return
-                write_run_meta(db_path, "trashed", "true")
+                write_run_meta(db_path, "trashed", new_value)
                 self._send_json({"ok": True})
                 return
 
@@ -293,25 +415,32 @@ class _RequestHandler(BaseHTTPRequestHandler):
         except Exception as e:
             self._send_error(500, str(e))
 
+    def _write_response(self, code: int, body: bytes) -> None:
+        """Write status line, headers, and body in a single socket write.
+
+        BaseHTTPRequestHandler's send_response/send_header/end_headers
+        path issues one wfile.write for the header block and another for
+        the body; building the full response ourselves halves the
+        syscalls on the hot JSON path.
+        """
+        reason = self.responses.get(code, ("",))[0]
+        head = (
+            f"{self.protocol_version} {code} {reason}\r\n".encode("latin-1")
+            + _CORS_HEADER_BYTES
+            + f"Content-Type: application/json\r\n"
+              f"Content-Length: {len(body)}\r\n\r\n".encode("latin-1")
+        )
+        self.wfile.write(head + body)
+
     def _send_json(self, data: Any) -> None:
         """Send a JSON response with CORS headers."""
-        body = json.dumps(_sanitize_for_json(data)).encode("utf-8")
-        self.send_response(200)
-        self._send_cors_headers()
-        self.send_header("Content-Type", "application/json")
-        self.send_header("Content-Length", str(len(body)))
-        self.end_headers()
-        self.wfile.write(body)
+        body = _dumps(_sanitize_for_json(data))
+        self._write_response(200, body)
 
     def _send_error(self, code: int, message: str) -> None:
         """Send a JSON error response."""
-        body = json.dumps({"error": message}).encode("utf-8")
-        self.send_response(code)
-        self._send_cors_headers()
-        self.send_header("Content-Type", "application/json")
-        self.send_header("Content-Length", str(len(body)))
-        self.end_headers()
-        self.wfile.write(body)
+        body = _dumps({"error": message})
+        self._write_response(code, body)
 
     def _send_cors_headers(self) -> None:
         """Add CORS headers to the response."""
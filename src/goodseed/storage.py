@@ -9,11 +9,14 @@ while the training process writes.
 
 from __future__ import annotations
 
+import functools
 import logging
 import math
 import os
 import sqlite3
 import threading
+from array import array
+from collections import OrderedDict
 from collections.abc import Iterator
 from contextlib import contextmanager
 from datetime import datetime, timezone
@@ -27,13 +30,26 @@ logger = logging.getLogger("goodseed.storage")
 
 
 def _get_connection(db_path: Path) -> sqlite3.Connection:
-    conn = sqlite3.connect(str(db_path), check_same_thread=False)
-    conn.execute("PRAGMA journal_mode=WAL")
-    conn.execute("PRAGMA synchronous=NORMAL")
-    conn.execute("PRAGMA busy_timeout=5000")
-    conn.execute("PRAGMA temp_store=MEMORY")
-    conn.execute("PRAGMA cache_size=-4000")
+    # A larger statement cache keeps the hot INSERT/SELECT statements
+    # compiled across calls instead of re-parsing by string hash.
+    conn = sqlite3.connect(str(db_path), check_same_thread=False, cached_statements=256)
+    # One executescript sets the whole bundle in a single round trip.
+    # wal_autocheckpoint/journal_size_limit keep the WAL from growing
+    # without bound between explicit checkpoints.
+    conn.executescript("""
+        PRAGMA journal_mode=WAL;
+        PRAGMA synchronous=NORMAL;
+        PRAGMA busy_timeout=5000;
+        PRAGMA temp_store=MEMORY;
+        PRAGMA cache_size=-65536;
+        PRAGMA mmap_size=268435456;
+        PRAGMA wal_autocheckpoint=1000;
+        PRAGMA journal_size_limit=67108864;
+    """)
     conn.row_factory = sqlite3.Row
+    # Manual transaction control: _transaction issues BEGIN IMMEDIATE
+    # itself instead of relying on the implicit DEFERRED begin.
+    conn.isolation_level = None
     return conn
 
 
@@ -41,6 +57,12 @@ SCHEMA_VERSION = 1
 
 
 def _init_schema(conn: sqlite3.Connection) -> None:
+    # user_version gates the DDL: reopening an existing database skips
+    # parsing the five CREATE ... IF NOT EXISTS statements entirely.
+    # Databases created before the gate carry user_version=0 and take the
+    # (harmless, idempotent) DDL path once before being stamped.
+    if conn.execute("PRAGMA user_version").fetchone()[0] >= SCHEMA_VERSION:
+        return
     conn.executescript("""
         CREATE TABLE IF NOT EXISTS run_meta (
             key TEXT PRIMARY KEY,
@@ -69,6 +91,11 @@ def _init_schema(conn: sqlite3.Connection) -> None:
             PRIMARY KEY (series_id, step)
         );
 
+        -- Covering index so point-scan JOINs resolve (id -> path) from
+        -- the index alone, never touching metric_series table rows.
+        CREATE INDEX IF NOT EXISTS ix_metric_series_id_path
+            ON metric_series(id, path);
+
         CREATE TABLE IF NOT EXISTS string_series (
             id INTEGER PRIMARY KEY AUTOINCREMENT,
             path TEXT NOT NULL UNIQUE
@@ -92,110 +119,190 @@ def _init_schema(conn: sqlite3.Connection) -> None:
             "INSERT INTO run_meta (key, value) VALUES ('schema_version', ?)",
             (str(SCHEMA_VERSION),),
         )
+    conn.execute(f"PRAGMA user_version={SCHEMA_VERSION}")
     conn.commit()
 
 
 class LocalStorage:
     """Thread-safe SQLite storage for a single run."""
 
-    def __init__(self, db_path: Path):
+    def __init__(self, db_path: Path | str):
+        # ":memory:" keeps the whole database off the filesystem — handy
+        # for unit tests and throwaway runs that never need persistence.
+        self._in_memory = str(db_path) == ":memory:"
         self.db_path = Path(db_path)
         self._lock = threading.RLock()
         self._conn: sqlite3.Connection | None = None
         self._series_cache: dict[str, int] = {}
         self._string_series_cache: dict[str, int] = {}
-
-        ensure_dir(self.db_path.parent)
+        self._reader_local = threading.local()
+        self._reader_conns: list[sqlite3.Connection] = []
+        self._readers_lock = threading.Lock()
+        self._dirty = False
+        # Lazily populated set of metric paths with at least one point;
+        # log_metric_points keeps it current so repeat get_metric_paths
+        # calls skip the DISTINCT scan.
+        self._paths_cache: set[str] | None = None
+
+        # WAL sidecar paths, precomputed once instead of rebuilding the
+        # strings on every checkpoint/delete.
+        self._wal_path = self.db_path.with_name(self.db_path.name + "-wal")
+        self._shm_path = self.db_path.with_name(self.db_path.name + "-shm")
+
+        if not self._in_memory:
+            ensure_dir(self.db_path.parent)
         self._conn = _get_connection(self.db_path)
         _init_schema(self._conn)
+        # Long-lived cursor for the hot write statements; conn.execute
+        # would allocate a fresh cursor per call. One-shot queries keep
+        # using the connection directly.
+        self._write_cursor = self._conn.cursor()
 
     @contextmanager
     def _transaction(self) -> Iterator[sqlite3.Connection]:
         with self._lock:
             if self._conn is None:
                 raise RuntimeError("Storage is closed")
+            # IMMEDIATE takes the write lock up front, so the batch never
+            # has to upgrade from a read lock mid-transaction (the case
+            # where SQLITE_BUSY can surface after work was already done).
+            self._conn.execute("BEGIN IMMEDIATE")
+            self._dirty = True
             try:
                 yield self._conn
-                self._conn.commit()
+                self._conn.execute("COMMIT")
             except Exception:
-                self._conn.rollback()
+                self._conn.execute("ROLLBACK")
+                # Series rows created inside this transaction were rolled
+                # back with it; drop the id caches so they cannot hand out
+                # ids that no longer exist in the database.
+                self._series_cache.clear()
+                self._string_series_cache.clear()
+                self._paths_cache = None
                 raise
 
+    def _reader(self) -> sqlite3.Connection:
+        """Return a thread-local read-only connection.
+
+        WAL allows reads to run concurrently with the writer, so pure
+        read paths use a per-thread ``mode=ro`` connection and skip the
+        storage lock entirely instead of serializing behind writes.
+        """
+        if self._conn is None:
+            raise RuntimeError("Storage is closed")
+        if self._in_memory:
+            # A mode=ro connection would open a different empty database;
+            # in-memory storage shares the writer connection instead.
+            return self._conn
+        conn = getattr(self._reader_local, "conn", None)
+        if conn is None:
+            conn = _open_readonly(self.db_path)
+            self._reader_local.conn = conn
+            with self._readers_lock:
+                self._reader_conns.append(conn)
+        return conn
+
     def _get_series_id(self, conn: sqlite3.Connection, path: str) -> int:
         """Get or create a series ID for a metric path. Must hold the lock."""
         sid = self._series_cache.get(path)
         if sid is not None:
             return sid
-        conn.execute(
-            "INSERT OR IGNORE INTO metric_series (path) VALUES (?)", (path,)
-        )
+        # SELECT first: on a reopened run the series usually exists already,
+        # and the miss path gets the new id from lastrowid without a
+        # second round trip.
         row = conn.execute(
             "SELECT id FROM metric_series WHERE path = ?", (path,)
         ).fetchone()
-        sid = row["id"]
+        if row is not None:
+            sid = row["id"]
+        else:
+            sid = conn.execute(
+                "INSERT INTO metric_series (path) VALUES (?)", (path,)
+            ).lastrowid
         self._series_cache[path] = sid
         return sid
 
     def set_meta(self, key: str, value: str) -> None:
-        with self._transaction() as conn:
-            conn.execute(
+        with self._transaction():
+            self._write_cursor.execute(
                 "INSERT OR REPLACE INTO run_meta (key, value) VALUES (?, ?)",
                 (key, value),
             )
 
     def get_meta(self, key: str) -> str | None:
-        with self._lock:
-            if self._conn is None:
-                raise RuntimeError("Storage is closed")
-            row = self._conn.execute(
-                "SELECT value FROM run_meta WHERE key = ?", (key,)
-            ).fetchone()
-            return row["value"] if row else None
+        conn = self._reader()
+        row = conn.execute(
+            "SELECT value FROM run_meta WHERE key = ?", (key,)
+        ).fetchone()
+        return row["value"] if row else None
 
     def log_configs(self, data: dict[str, tuple[str, str]]) -> None:
-        """Log config values. data: {path: (type_tag, serialized_value)}"""
+        """Log config values. data: {path: (type_tag, serialized_value)}
+
+        Paths must already be canonical (see ``utils.normalize_path``);
+        Run normalizes once at its public entry points so neither this
+        method nor any read path re-strips slashes per row.
+        """
         now = datetime.now(timezone.utc).isoformat()
-        with self._transaction() as conn:
-            for path, (type_tag, value) in data.items():
-                conn.execute(
-                    """INSERT OR REPLACE INTO configs
-                       (path, type_tag, value, updated_at)
-                       VALUES (?, ?, ?, ?)""",
-                    (path, type_tag, value, now),
-                )
+        with self._transaction():
+            # Upsert: OR REPLACE deletes and re-inserts on conflict; the
+            # update form touches the B-tree once. uploaded resets so the
+            # sync process re-uploads the new value.
+            self._write_cursor.executemany(
+                """INSERT INTO configs
+                   (path, type_tag, value, updated_at)
+                   VALUES (?, ?, ?, ?)
+                   ON CONFLICT (path) DO UPDATE SET
+                       type_tag = excluded.type_tag,
+                       value = excluded.value,
+                       updated_at = excluded.updated_at,
+                       uploaded = 0""",
+                [(path, type_tag, value, now) for path, (type_tag, value) in data.items()],
+            )
 
     def get_configs(self) -> dict[str, tuple[str, str]]:
         """Get all configs as {path: (type_tag, value)}."""
-        with self._lock:
-            if self._conn is None:
-                raise RuntimeError("Storage is closed")
-            rows = self._conn.execute(
-                "SELECT path, type_tag, value FROM configs"
-            ).fetchall()
-            return {row["path"]: (row["type_tag"], row["value"]) for row in rows}
+        cur = self._reader().cursor()
+        cur.row_factory = None
+        cur.execute("SELECT path, type_tag, value FROM configs")
+        return {path: (type_tag, value) for path, type_tag, value in cur}
 
     def get_config(self, path: str) -> tuple[str, str] | None:
         """Get a single config value as (type_tag, value), or None."""
-        with self._lock:
-            if self._conn is None:
-                raise RuntimeError("Storage is closed")
-            row = self._conn.execute(
-                "SELECT type_tag, value FROM configs WHERE path = ?", (path,)
-            ).fetchone()
-            return (row["type_tag"], row["value"]) if row else None
+        cur = self._reader().cursor()
+        cur.row_factory = None
+        row = cur.execute(
+            "SELECT type_tag, value FROM configs WHERE path = ?", (path,)
+        ).fetchone()
+        return row
 
     def log_metric_points(
         self, points: list[tuple[str, int | float, float, int]]
     ) -> None:
-        """Log metric points. Each tuple: (path, step, y, ts_unix)."""
+        """Log metric points. Each tuple: (path, step, y, ts_unix).
+
+        Paths must already be canonical (normalized by Run); storing a
+        non-canonical spelling would create a duplicate series row.
+        """
         with self._transaction() as conn:
-            for path, step, y, ts in points:
-                series_id = self._get_series_id(conn, path)
-                conn.execute(
-                    """INSERT OR REPLACE INTO metric_points
-                       (series_id, step, y, ts) VALUES (?, ?, ?, ?)""",
-                    (series_id, step, y, ts),
-                )
+            # Resolve any unseen series first, then insert all points in a
+            # single executemany batch (one Python->SQLite call).
+            new_paths = {p for p, _, _, _ in points} - self._series_cache.keys()
+            for path in new_paths:
+                self._get_series_id(conn, path)
+            cache = self._series_cache
+            # Upsert instead of INSERT OR REPLACE: replacing deletes and
+            # re-inserts the row (two B-tree mutations and extra WAL pages)
+            # even though re-logging a (path, step) pair is the rare case.
+            self._write_cursor.executemany(
+                """INSERT INTO metric_points
+                   (series_id, step, y, ts) VALUES (?, ?, ?, ?)
+                   ON CONFLICT (series_id, step)
+                   DO UPDATE SET y = excluded.y, ts = excluded.ts, uploaded = 0""",
+                ((cache[p], step, y, ts) for p, step, y, ts in points),
+            )
+            if self._paths_cache is not None:
+                self._paths_cache.update(p for p, _, _, _ in points)
 
     def get_last_metric_step(self, path: str) -> int | float | None:
         """Get the last (maximum) step value for a metric series."""
@@ -222,75 +329,126 @@ class LocalStorage:
         self, path: str | None = None
     ) -> list[dict[str, Any]]:
         """Get metric points, optionally filtered by path."""
-        with self._lock:
-            if self._conn is None:
-                raise RuntimeError("Storage is closed")
-            if path:
-                rows = self._conn.execute(
-                    """SELECT s.path, p.step, p.y, p.ts
-                       FROM metric_points p
-                       JOIN metric_series s ON p.series_id = s.id
-                       WHERE s.path = ?
-                       ORDER BY p.step""",
-                    (path,),
-                ).fetchall()
-            else:
-                rows = self._conn.execute(
-                    """SELECT s.path, p.step, p.y, p.ts
-                       FROM metric_points p
-                       JOIN metric_series s ON p.series_id = s.id
-                       ORDER BY s.path, p.step"""
-                ).fetchall()
-            return [dict(row) for row in rows]
+        # Tuple rows + literal-key dicts: dict(sqlite3.Row) pays a
+        # column-name scan per field, noticeable at many points.
+        return [
+            {"path": p, "step": step, "y": y, "ts": ts}
+            for rows in self.iter_metric_points(path)
+            for p, step, y, ts in rows
+        ]
 
-    def get_all_max_steps(self) -> dict[str, int | float]:
-        """Get the max step for every metric and string series path."""
-        with self._lock:
-            if self._conn is None:
-                raise RuntimeError("Storage is closed")
-            result: dict[str, int | float] = {}
-            rows = self._conn.execute(
-                """SELECT s.path, MAX(p.step) as max_step
+    def iter_metric_points(
+        self, path: str | None = None, chunk_size: int = 10_000
+    ) -> Iterator[list[tuple[str, float, float, int]]]:
+        """Yield metric points as chunks of (path, step, y, ts) tuples.
+
+        Streams the result with fetchmany so a run with millions of
+        points never holds more than *chunk_size* rows in Python at
+        once. Chunks are ordered by (path, step).
+        """
+        cur = self._reader().cursor()
+        cur.row_factory = None
+        if path:
+            cur.execute(
+                """SELECT s.path, p.step, p.y, p.ts
                    FROM metric_points p
                    JOIN metric_series s ON p.series_id = s.id
-                   GROUP BY s.path"""
-            ).fetchall()
-            for row in rows:
-                result[row["path"]] = row["max_step"]
-            rows = self._conn.execute(
-                """SELECT s.path, MAX(p.step) as max_step
-                   FROM string_points p
-                   JOIN string_series s ON p.series_id = s.id
-                   GROUP BY s.path"""
-            ).fetchall()
-            for row in rows:
-                result[row["path"]] = row["max_step"]
-            return result
+                   WHERE s.path = ?
+                   ORDER BY p.step""",
+                (path,),
+            )
+        else:
+            cur.execute(
+                """SELECT s.path, p.step, p.y, p.ts
+                   FROM metric_points p
+                   JOIN metric_series s ON p.series_id = s.id
+                   ORDER BY s.path, p.step"""
+            )
+        while True:
+            rows = cur.fetchmany(chunk_size)
+            if not rows:
+                return
+            yield rows
+
+    def get_metric_points_columnar(self, path: str) -> dict[str, array]:
+        """Get one series' points as columnar arrays keyed step/y/ts.
+
+        Structure-of-arrays form: ~24 bytes per point versus ~200 for
+        the list-of-dicts returned by get_metric_points, with no Python
+        object per row. steps are stored as REAL, so the step column is
+        a float array.
+        """
+        cur = self._reader().cursor()
+        cur.row_factory = None
+        cur.execute(
+            """SELECT p.step, p.y, p.ts
+               FROM metric_points p
+               JOIN metric_series s ON p.series_id = s.id
+               WHERE s.path = ?
+               ORDER BY p.step""",
+            (path,),
+        )
+        steps: array = array("d")
+        ys: array = array("d")
+        tss: array = array("q")
+        for step, y, ts in cur:
+            steps.append(step)
+            ys.append(y)
+            tss.append(ts)
+        return {"step": steps, "y": ys, "ts": tss}
+
+    def get_all_max_steps(self) -> dict[str, int | float]:
+        """Get the max step for every metric and string series path."""
+        conn = self._reader()
+        result: dict[str, int | float] = {}
+        rows = conn.execute(
+            """SELECT s.path, MAX(p.step) as max_step
+               FROM metric_points p
+               JOIN metric_series s ON p.series_id = s.id
+               GROUP BY s.path"""
+        ).fetchall()
+        for row in rows:
+            result[row["path"]] = row["max_step"]
+        rows = conn.execute(
+            """SELECT s.path, MAX(p.step) as max_step
+               FROM string_points p
+               JOIN string_series s ON p.series_id = s.id
+               GROUP BY s.path"""
+        ).fetchall()
+        for row in rows:
+            result[row["path"]] = row["max_step"]
+        return result
 
     def get_metric_paths(self) -> list[str]:
         """Get all metric paths that have at least one point."""
         with self._lock:
-            if self._conn is None:
-                raise RuntimeError("Storage is closed")
-            rows = self._conn.execute(
-                """SELECT DISTINCT s.path FROM metric_series s
-                   JOIN metric_points p ON s.id = p.series_id
-                   ORDER BY s.path"""
-            ).fetchall()
-            return [row["path"] for row in rows]
+            if self._paths_cache is not None:
+                return sorted(self._paths_cache)
+        conn = self._reader()
+        rows = conn.execute(
+            """SELECT s.path FROM metric_series s
+               WHERE EXISTS (SELECT 1 FROM metric_points p WHERE p.series_id = s.id)
+               ORDER BY s.path"""
+        ).fetchall()
+        paths = [row["path"] for row in rows]
+        with self._lock:
+            self._paths_cache = set(paths)
+        return paths
 
     def _get_string_series_id(self, conn: sqlite3.Connection, path: str) -> int:
         """Get or create a series ID for a string series path. Must hold the lock."""
         sid = self._string_series_cache.get(path)
         if sid is not None:
             return sid
-        conn.execute(
-            "INSERT OR IGNORE INTO string_series (path) VALUES (?)", (path,)
-        )
         row = conn.execute(
             "SELECT id FROM string_series WHERE path = ?", (path,)
         ).fetchone()
-        sid = row["id"]
+        if row is not None:
+            sid = row["id"]
+        else:
+            sid = conn.execute(
+                "INSERT INTO string_series (path) VALUES (?)", (path,)
+            ).lastrowid
         self._string_series_cache[path] = sid
         return sid
 
@@ -299,13 +457,15 @@ class LocalStorage:
     ) -> None:
         """Log string series points. Each tuple: (path, step, value, ts_unix)."""
         with self._transaction() as conn:
-            for path, step, value, ts in points:
-                series_id = self._get_string_series_id(conn, path)
-                conn.execute(
-                    """INSERT OR REPLACE INTO string_points
-                       (series_id, step, value, ts) VALUES (?, ?, ?, ?)""",
-                    (series_id, step, value, ts),
-                )
+            new_paths = {p for p, _, _, _ in points} - self._string_series_cache.keys()
+            for path in new_paths:
+                self._get_string_series_id(conn, path)
+            cache = self._string_series_cache
+            self._write_cursor.executemany(
+                """INSERT OR REPLACE INTO string_points
+                   (series_id, step, value, ts) VALUES (?, ?, ?, ?)""",
+                ((cache[p], step, value, ts) for p, step, value, ts in points),
+            )
 
     def get_last_string_step(self, path: str) -> int | float | None:
         """Get the last (maximum) step value for a string series."""
@@ -332,54 +492,56 @@ class LocalStorage:
         self, path: str | None = None
     ) -> list[dict[str, Any]]:
         """Get string series points, optionally filtered by path."""
-        with self._lock:
-            if self._conn is None:
-                raise RuntimeError("Storage is closed")
-            if path:
-                rows = self._conn.execute(
-                    """SELECT s.path, p.step, p.value, p.ts
-                       FROM string_points p
-                       JOIN string_series s ON p.series_id = s.id
-                       WHERE s.path = ?
-                       ORDER BY p.step""",
-                    (path,),
-                ).fetchall()
-            else:
-                rows = self._conn.execute(
-                    """SELECT s.path, p.step, p.value, p.ts
-                       FROM string_points p
-                       JOIN string_series s ON p.series_id = s.id
-                       ORDER BY s.path, p.step"""
-                ).fetchall()
-            return [dict(row) for row in rows]
+        cur = self._reader().cursor()
+        cur.row_factory = None
+        if path:
+            cur.execute(
+                """SELECT s.path, p.step, p.value, p.ts
+                   FROM string_points p
+                   JOIN string_series s ON p.series_id = s.id
+                   WHERE s.path = ?
+                   ORDER BY p.step""",
+                (path,),
+            )
+        else:
+            cur.execute(
+                """SELECT s.path, p.step, p.value, p.ts
+                   FROM string_points p
+                   JOIN string_series s ON p.series_id = s.id
+                   ORDER BY s.path, p.step"""
+            )
+        return [
+            {"path": p, "step": step, "value": value, "ts": ts}
+            for p, step, value, ts in cur
+        ]
 
     def get_string_series_paths(self) -> list[str]:
         """Get all string series paths that have at least one point."""
-        with self._lock:
-            if self._conn is None:
-                raise RuntimeError("Storage is closed")
-            rows = self._conn.execute(
-                """SELECT DISTINCT s.path FROM string_series s
-                   JOIN string_points p ON s.id = p.series_id
-                   ORDER BY s.path"""
-            ).fetchall()
-            return [row["path"] for row in rows]
+        conn = self._reader()
+        rows = conn.execute(
+            """SELECT DISTINCT s.path FROM string_series s
+               JOIN string_points p ON s.id = p.series_id
+               ORDER BY s.path"""
+        ).fetchall()
+        return [row["path"] for row in rows]
 
     def get_unuploaded_metric_points(self, limit: int = 5000) -> list[dict[str, Any]]:
         """Get metric points not yet uploaded, with their series path."""
-        with self._lock:
-            if self._conn is None:
-                raise RuntimeError("Storage is closed")
-            rows = self._conn.execute(
-                """SELECT s.path, p.series_id, p.step, p.y, p.ts
-                   FROM metric_points p
-                   JOIN metric_series s ON p.series_id = s.id
-                   WHERE p.uploaded = 0
-                   ORDER BY p.ts
-                   LIMIT ?""",
-                (limit,),
-            ).fetchall()
-            return [dict(row) for row in rows]
+        cur = self._reader().cursor()
+        cur.row_factory = None
+        cur.execute(
+            """SELECT s.path, p.series_id, p.step, p.y, p.ts
+               FROM metric_points p
+               JOIN metric_series s ON p.series_id = s.id
+               WHERE p.uploaded = 0
+               ORDER BY p.ts
+               LIMIT ?""",
+            (limit,),
+        )
+        return [
+            {"path": p, "series_id": sid, "step": step, "y": y, "ts": ts}
+            for p, sid, step, y, ts in cur
+        ]
 
     def mark_metric_points_uploaded(
         self, keys: list[tuple[int, float, float, int]]
@@ -398,19 +560,21 @@ class LocalStorage:
 
     def get_unuploaded_string_points(self, limit: int = 5000) -> list[dict[str, Any]]:
         """Get string points not yet uploaded, with their series path."""
-        with self._lock:
-            if self._conn is None:
-                raise RuntimeError("Storage is closed")
-            rows = self._conn.execute(
-                """SELECT s.path, p.series_id, p.step, p.value, p.ts
-                   FROM string_points p
-                   JOIN string_series s ON p.series_id = s.id
-                   WHERE p.uploaded = 0
-                   ORDER BY p.ts
-                   LIMIT ?""",
-                (limit,),
-            ).fetchall()
-            return [dict(row) for row in rows]
+        cur = self._reader().cursor()
+        cur.row_factory = None
+        cur.execute(
+            """SELECT s.path, p.series_id, p.step, p.value, p.ts
+               FROM string_points p
+               JOIN string_series s ON p.series_id = s.id
+               WHERE p.uploaded = 0
+               ORDER BY p.ts
+               LIMIT ?""",
+            (limit,),
+        )
+        return [
+            {"path": p, "series_id": sid, "step": step, "value": value, "ts": ts}
+            for p, sid, step, value, ts in cur
+        ]
 
     def mark_string_points_uploaded(
         self, keys: list[tuple[int, float, str, int]]
@@ -428,13 +592,13 @@ class LocalStorage:
 
     def get_unuploaded_configs(self) -> list[dict[str, Any]]:
         """Get configs not yet uploaded."""
-        with self._lock:
-            if self._conn is None:
-                raise RuntimeError("Storage is closed")
-            rows = self._conn.execute(
-                "SELECT path, type_tag, value FROM configs WHERE uploaded = 0"
-            ).fetchall()
-            return [dict(row) for row in rows]
+        cur = self._reader().cursor()
+        cur.row_factory = None
+        cur.execute("SELECT path, type_tag, value FROM configs WHERE uploaded = 0")
+        return [
+            {"path": p, "type_tag": t, "value": v}
+            for p, t, v in cur
+        ]
 
     def mark_configs_uploaded(
         self, keys: list[tuple[str, str, str]]
@@ -452,23 +616,21 @@ class LocalStorage:
 
     def field_exists(self, path: str) -> bool:
         """Check if a field exists in configs, metric_series, or string_series."""
-        with self._lock:
-            if self._conn is None:
-                raise RuntimeError("Storage is closed")
-            row = self._conn.execute(
-                "SELECT 1 FROM configs WHERE path = ? LIMIT 1", (path,)
-            ).fetchone()
-            if row:
-                return True
-            row = self._conn.execute(
-                "SELECT 1 FROM metric_series WHERE path = ? LIMIT 1", (path,)
-            ).fetchone()
-            if row:
-                return True
-            row = self._conn.execute(
-                "SELECT 1 FROM string_series WHERE path = ? LIMIT 1", (path,)
-            ).fetchone()
-            return row is not None
+        conn = self._reader()
+        row = conn.execute(
+            "SELECT 1 FROM configs WHERE path = ? LIMIT 1", (path,)
+        ).fetchone()
+        if row:
+            return True
+        row = conn.execute(
+            "SELECT 1 FROM metric_series WHERE path = ? LIMIT 1", (path,)
+        ).fetchone()
+        if row:
+            return True
+        row = conn.execute(
+            "SELECT 1 FROM string_series WHERE path = ? LIMIT 1", (path,)
+        ).fetchone()
+        return row is not None
 
     def get_last_metric_value(self, path: str) -> tuple[float, float] | None:
         """Get the last (step, y) for a metric series, or None."""
@@ -514,22 +676,48 @@ class LocalStorage:
 
     def count_unuploaded(self) -> int:
         """Return total count of unuploaded items across all tables."""
+        conn = self._reader()
+        total = 0
+        for table in ("metric_points", "string_points", "configs"):
+            row = conn.execute(
+                f"SELECT COUNT(*) as cnt FROM {table} WHERE uploaded = 0"
+            ).fetchone()
+            total += row["cnt"]
+        return total
+
+    def checkpoint_passive(self) -> None:
+        """Opportunistically copy WAL frames back into the database.
+
+        PASSIVE never blocks on readers (it just does whatever work it
+        can), so it is safe to call periodically during training to keep
+        the WAL small. The blocking TRUNCATE form stays reserved for
+        close().
+        """
         with self._lock:
             if self._conn is None:
                 raise RuntimeError("Storage is closed")
-            total = 0
-            for table in ("metric_points", "string_points", "configs"):
-                row = self._conn.execute(
-                    f"SELECT COUNT(*) as cnt FROM {table} WHERE uploaded = 0"
-                ).fetchone()
-                total += row["cnt"]
-            return total
+            self._conn.execute("PRAGMA wal_checkpoint(PASSIVE)").fetchone()
 
     def checkpoint_wal(self) -> None:
-        """Checkpoint WAL to consolidate into a single .sqlite file."""
+        """Checkpoint WAL to consolidate into a single .sqlite file.
+
+        Runs the non-blocking PASSIVE form first so the bulk of the
+        frame copying never waits on readers; the blocking TRUNCATE pass
+        that guarantees an empty WAL then only has the leftovers (none,
+        in the common case) to deal with. Skipped entirely when the WAL
+        is already empty.
+        """
+        if self._in_memory or not self._dirty:
+            return
         with self._lock:
             if self._conn is None:
                 raise RuntimeError("Storage is closed")
+            try:
+                if self._wal_path.stat().st_size == 0:
+                    return
+            except OSError:
+                return
+            self._conn.execute("PRAGMA wal_checkpoint(PASSIVE)").fetchone()
             self._conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
 
     def close(self) -> None:
@@ -537,19 +725,19 @@ class LocalStorage:
             if self._conn is not None:
                 self._conn.close()
                 self._conn = None
+        with self._readers_lock:
+            for conn in self._reader_conns:
+                conn.close()
+            self._reader_conns.clear()
 
     def delete_db_file(self) -> None:
         """Close connection and delete the database file."""
         self.close()
-        for path in (
-            self.db_path,
-            Path(str(self.db_path) + "-wal"),
-            Path(str(self.db_path) + "-shm"),
-        ):
-            try:
-                os.unlink(path)
-            except FileNotFoundError:
-                pass
+        if self._in_memory:
+            return
+        self.db_path.unlink(missing_ok=True)
+        self._wal_path.unlink(missing_ok=True)
+        self._shm_path.unlink(missing_ok=True)
 
     def __enter__(self) -> LocalStorage:
         return self
@@ -559,32 +747,96 @@ class LocalStorage:
 
 
 # Read-only query functions used by the server and CLI.
-# Each function opens a temporary read-only connection.
+# Connections are cached per database path (see _cached_reader) so that
+# repeated requests against the same run skip the open/PRAGMA overhead.
 
 
 def _open_readonly(db_path: Path) -> sqlite3.Connection:
     """Open a SQLite database in read-only mode."""
     uri = f"file:{db_path}?mode=ro"
-    conn = sqlite3.connect(uri, uri=True, check_same_thread=False)
+    conn = sqlite3.connect(uri, uri=True, check_same_thread=False, cached_statements=256)
     conn.execute("PRAGMA busy_timeout=3000")
     conn.execute("PRAGMA foreign_keys=ON")
+    # Readers never write, so trade memory for speed: memory-map the
+    # database file (page reads skip the syscall + memcpy path), keep a
+    # larger page cache for repeated range scans, and spill any sort/temp
+    # b-trees to memory. query_only guards against accidental writes.
+    conn.execute("PRAGMA mmap_size=268435456")
+    conn.execute("PRAGMA cache_size=-20000")
+    conn.execute("PRAGMA temp_store=MEMORY")
+    conn.execute("PRAGMA query_only=1")
     conn.row_factory = sqlite3.Row
     return conn
 
 
+_READER_CACHE_SIZE = 64
+
+# db_path str -> (mtime, connection), ordered oldest-first for LRU eviction.
+_reader_cache: OrderedDict[str, tuple[float, sqlite3.Connection]] = OrderedDict()
+_reader_cache_lock = threading.Lock()
+
+
+def _cached_reader(db_path: Path) -> sqlite3.Connection:
+    """Return a (possibly cached) read-only connection for *db_path*.
+
+    WAL mode means a cached reader sees new commits without reopening;
+    entries are invalidated when the file itself is rewritten (mtime
+    change — checkpoints do this too, so it is not rare), and the least
+    recently used entry is dropped once the cache exceeds
+    _READER_CACHE_SIZE entries. Dropped connections are never closed
+    here: another server thread may still be mid-query on them, and
+    closing under a running cursor raises ProgrammingError. They are
+    reclaimed by GC once the last cursor lets go.
+    """
+    mtime = os.stat(db_path).st_mtime
+    key = str(db_path)
+    with _reader_cache_lock:
+        entry = _reader_cache.get(key)
+        if entry is not None:
+            cached_mtime, conn = entry
+            if cached_mtime == mtime:
+                _reader_cache.move_to_end(key)
+                return conn
+            del _reader_cache[key]
+
+    conn = _open_readonly(db_path)
+    with _reader_cache_lock:
+        _reader_cache[key] = (mtime, conn)
+        while len(_reader_cache) > _READER_CACHE_SIZE:
+            _reader_cache.popitem(last=False)
+    return conn
+
+
+def clear_reader_cache() -> None:
+    """Drop all cached read-only connections.
+
+    Mainly useful when a projects directory is being torn down (or in
+    tests) so no cached connection pins a database file open. Idle
+    connections are closed by GC as soon as the cache lets go; ones
+    still serving a query are closed when that query finishes.
+    """
+    with _reader_cache_lock:
+        _reader_cache.clear()
+
+
+@functools.lru_cache(maxsize=4096)
 def _ts_to_iso(ts: int) -> str:
-    """Convert a unix timestamp to ISO 8601 string."""
+    """Convert a unix timestamp to ISO 8601 string.
+
+    Cached: metric points logged in the same second share a timestamp, so
+    most calls during a read are repeats of the previous value.
+    """
     return datetime.fromtimestamp(ts, tz=timezone.utc).isoformat()
 
 
 def read_run_meta(db_path: Path) -> dict[str, str]:
     """Read all run_meta key-value pairs from a run database."""
-    conn = _open_readonly(db_path)
-    try:
-        rows = conn.execute("SELECT key, value FROM run_meta").fetchall()
-        return {row["key"]: row["value"] for row in rows}
-    finally:
-        conn.close()
+    conn = _cached_reader(db_path)
+    # Plain tuple rows: dict() consumes (key, value) pairs in C, avoiding
+    # sqlite3.Row's per-access column-name scan.
+    cur = conn.cursor()
+    cur.row_factory = None
+    return dict(cur.execute("SELECT key, value FROM run_meta"))
 
 
 def read_run_summary(
@@ -594,37 +846,32 @@ def read_run_summary(
 
     Returns (meta_dict, string_series_paths, metric_paths).
     """
-    conn = _open_readonly(db_path)
-    try:
-        meta_rows = conn.execute("SELECT key, value FROM run_meta").fetchall()
-        meta = {row["key"]: row["value"] for row in meta_rows}
+    conn = _cached_reader(db_path)
+    cur = conn.cursor()
+    cur.row_factory = None
+    meta = dict(cur.execute("SELECT key, value FROM run_meta"))
 
-        ss_rows = conn.execute(
-            """SELECT DISTINCT s.path FROM string_series s
-               JOIN string_points p ON s.id = p.series_id
-               ORDER BY s.path"""
-        ).fetchall()
-        string_series_paths = [row["path"] for row in ss_rows]
+    ss_rows = cur.execute(
+        """SELECT s.path FROM string_series s
+           WHERE EXISTS (SELECT 1 FROM string_points p WHERE p.series_id = s.id)
+           ORDER BY s.path"""
+    ).fetchall()
+    string_series_paths = [path for (path,) in ss_rows]
 
-        mp_rows = conn.execute(
-            """SELECT DISTINCT s.path FROM metric_series s
-               JOIN metric_points p ON s.id = p.series_id
-               ORDER BY s.path"""
-        ).fetchall()
-        metric_paths = [row["path"] for row in mp_rows]
+    mp_rows = cur.execute(
+        """SELECT s.path FROM metric_series s
+           WHERE EXISTS (SELECT 1 FROM metric_points p WHERE p.series_id = s.id)
+           ORDER BY s.path"""
+    ).fetchall()
+    metric_paths = [path for (path,) in mp_rows]
 
-        return meta, string_series_paths, metric_paths
-    finally:
-        conn.close()
+    return meta, string_series_paths, metric_paths
 
 
 def read_configs(db_path: Path) -> dict[str, Any]:
     """Read configs from a run database and deserialize values."""
-    conn = _open_readonly(db_path)
-    try:
-        rows = conn.execute("SELECT path, type_tag, value FROM configs").fetchall()
-    finally:
-        conn.close()
+    conn = _cached_reader(db_path)
+    rows = conn.execute("SELECT path, type_tag, value FROM configs").fetchall()
 
     configs = {}
     for row in rows:
@@ -636,49 +883,98 @@ def read_metrics(
     db_path: Path, metric_path: str | None = None,
 ) -> list[dict[str, Any]]:
     """Read metric points from a run database."""
-    conn = _open_readonly(db_path)
-    try:
-        if metric_path:
-            rows = conn.execute(
-                """SELECT s.path, p.step, p.y, p.ts
-                   FROM metric_points p
-                   JOIN metric_series s ON p.series_id = s.id
-                   WHERE s.path = ?
-                   ORDER BY p.step""",
-                (metric_path,),
-            ).fetchall()
-        else:
-            rows = conn.execute(
-                """SELECT s.path, p.step, p.y, p.ts
-                   FROM metric_points p
-                   JOIN metric_series s ON p.series_id = s.id
-                   ORDER BY s.path, p.step"""
-            ).fetchall()
-    finally:
-        conn.close()
+    conn = _cached_reader(db_path)
+    # Positional tuple access: sqlite3.Row name lookups are a measurable
+    # cost at one-row-per-point scale.
+    cur = conn.cursor()
+    cur.row_factory = None
+    if metric_path:
+        cur.execute(
+            """SELECT s.path, p.step, p.y, p.ts
+               FROM metric_points p
+               JOIN metric_series s ON p.series_id = s.id
+               WHERE s.path = ?
+               ORDER BY p.step""",
+            (metric_path,),
+        )
+    else:
+        cur.execute(
+            """SELECT s.path, p.step, p.y, p.ts
+               FROM metric_points p
+               JOIN metric_series s ON p.series_id = s.id
+               ORDER BY s.path, p.step"""
+        )
 
     return [
         {
-            "path": row["path"],
-            "step": row["step"],
-            "value": row["y"],
-            "logged_at": _ts_to_iso(row["ts"]),
+            "path": path,
+            "step": step,
+            "value": y,
+            "logged_at": _ts_to_iso(ts),
         }
-        for row in rows
+        for path, step, y, ts in cur
     ]
 
 
+def read_metrics_json(
+    db_path: Path, metric_path: str | None = None,
+) -> bytes | None:
+    """Read metric points as a JSON array encoded inside SQLite.
+
+    Builds the same objects as ``read_metrics`` but uses json_group_array /
+    json_object so no per-row Python dict or datetime is materialized; the
+    result is a UTF-8 JSON array ready to embed in an HTTP response.
+
+    Returns None when SQLite cannot encode the rows (e.g. infinite values);
+    callers should fall back to ``read_metrics``.
+    Note: SQLite prints floats with 15 significant digits, so values may
+    differ from Python's repr in the last ulp.
+    """
+    conn = _cached_reader(db_path)
+    where = "WHERE s.path = ?" if metric_path else ""
+    params = (metric_path,) if metric_path else ()
+    order = "p.step" if metric_path else "s.path, p.step"
+    # json_object does not reliably reject non-finite values: older SQLite
+    # raises, but newer versions emit a bare `Inf`, which is not valid
+    # JSON. Check for such values up front and let the caller fall back to
+    # the Python encoder (9e999 overflows to +Inf in SQLite; NaN cannot
+    # reach the column — y is NOT NULL and sqlite3 binds NaN as NULL).
+    bad = conn.execute(
+        f"""SELECT EXISTS (
+                SELECT 1 FROM metric_points p
+                JOIN metric_series s ON p.series_id = s.id
+                {where + ' AND' if where else 'WHERE'}
+                    (p.y IS NULL OR p.y >= 9e999 OR p.y <= -9e999))""",
+        params,
+    ).fetchone()[0]
+    if bad:
+        return None
+    try:
+        row = conn.execute(
+            f"""SELECT json_group_array(json_object(
+                    'path', path, 'step', step, 'value', y,
+                    'logged_at', strftime('%Y-%m-%dT%H:%M:%S+00:00', ts, 'unixepoch')))
+                FROM (SELECT s.path, p.step, p.y, p.ts
+                      FROM metric_points p
+                      JOIN metric_series s ON p.series_id = s.id
+                      {where}
+                      ORDER BY {order})""",
+            params,
+        ).fetchone()
+    except sqlite3.OperationalError as e:
+        logger.debug("SQLite-side JSON encoding unavailable for %s: %s", db_path, e)
+        return None
+    return row[0].encode("utf-8") if row and row[0] else b"[]"
+
+
 def read_metric_paths(db_path: Path) -> list[str]:
     """Read distinct metric paths from a run database."""
-    conn = _open_readonly(db_path)
-    try:
-        rows = conn.execute(
-            """SELECT DISTINCT s.path FROM metric_series s
-               JOIN metric_points p ON s.id = p.series_id
-               ORDER BY s.path"""
-        ).fetchall()
-    finally:
-        conn.close()
+    conn = _cached_reader(db_path)
+    rows = conn.execute(
+        """SELECT s.path FROM metric_series s
+           WHERE EXISTS (SELECT 1 FROM metric_points p WHERE p.series_id = s.id)
+           ORDER BY s.path"""
+    ).fetchall()
     return [row["path"] for row in rows]
 
 
@@ -696,7 +992,7 @@ def read_string_series(
 
     If tail is given, returns the last tail rows (overrides limit/offset).
     """
-    conn = _open_readonly(db_path)
+    conn = _cached_reader(db_path)
     try:
         where = "WHERE s.path = ?" if series_path else ""
         base_params: list = [series_path] if series_path else []
@@ -736,8 +1032,6 @@ def read_string_series(
     except sqlite3.OperationalError as e:
         logger.debug("string_series table not available in %s: %s", db_path, e)
         return {"points": [], "total": 0}
-    finally:
-        conn.close()
 
     points = [
         {
@@ -764,53 +1058,50 @@ def downsample_metrics(
     ceil(N/k) <= point_count, then returns one aggregated point per
     bucket (avg step/value, min/max Y) plus exact first/last bookend points.
     """
-    conn = _open_readonly(db_path)
-    try:
-        count_row = conn.execute(
-            """SELECT COUNT(*) AS cnt
-               FROM metric_points p
-               JOIN metric_series s ON p.series_id = s.id
-               WHERE s.path = ?""",
-            (metric_path,),
-        ).fetchone()
-        total_count = count_row["cnt"] if count_row else 0
-
-        if total_count == 0:
-            return {
-                "points": [],
-                "firstPointIndex": 0,
-                "lastPointIndex": 0,
-                "totalCount": 0,
-                "downsampled": False,
-            }
+    conn = _cached_reader(db_path)
+    count_row = conn.execute(
+        """SELECT COUNT(*) AS cnt
+           FROM metric_points p
+           JOIN metric_series s ON p.series_id = s.id
+           WHERE s.path = ?""",
+        (metric_path,),
+    ).fetchone()
+    total_count = count_row["cnt"] if count_row else 0
 
-        fpi = max(0, first_point_index) if first_point_index is not None else 0
-        lpi = min(total_count - 1, last_point_index) if last_point_index is not None else total_count - 1
-        if fpi > lpi:
-            return {
-                "points": [],
-                "firstPointIndex": fpi,
-                "lastPointIndex": lpi,
-                "totalCount": total_count,
-                "downsampled": False,
-            }
+    if total_count == 0:
+        return {
+            "points": [],
+            "firstPointIndex": 0,
+            "lastPointIndex": 0,
+            "totalCount": 0,
+            "downsampled": False,
+        }
 
-        rows = conn.execute(
-            """WITH numbered AS (
-                   SELECT p.step, p.y, p.ts,
-                          ROW_NUMBER() OVER (ORDER BY p.step) - 1 AS rn
-                   FROM metric_points p
-                   JOIN metric_series s ON p.series_id = s.id
-                   WHERE s.path = ?
-               )
-               SELECT step, y, ts, rn
-               FROM numbered
-               WHERE rn >= ? AND rn <= ?
-               ORDER BY rn""",
-            (metric_path, fpi, lpi),
-        ).fetchall()
-    finally:
-        conn.close()
+    fpi = max(0, first_point_index) if first_point_index is not None else 0
+    lpi = min(total_count - 1, last_point_index) if last_point_index is not None else total_count - 1
+    if fpi > lpi:
+        return {
+            "points": [],
+            "firstPointIndex": fpi,
+            "lastPointIndex": lpi,
+            "totalCount": total_count,
+            "downsampled": False,
+        }
+
+    rows = conn.execute(
+        """WITH numbered AS (
+               SELECT p.step, p.y, p.ts,
+                      ROW_NUMBER() OVER (ORDER BY p.step) - 1 AS rn
+               FROM metric_points p
+               JOIN metric_series s ON p.series_id = s.id
+               WHERE s.path = ?
+           )
+           SELECT step, y, ts, rn
+           FROM numbered
+           WHERE rn >= ? AND rn <= ?
+           ORDER BY rn""",
+        (metric_path, fpi, lpi),
+    ).fetchall()
 
     raw_count = len(rows)
 
@@ -7,39 +7,66 @@ import random
 from datetime import datetime
 from typing import Any, Union
 
-# Word lists for readable run IDs (adjective-animal format)
-ADJECTIVES = [
+try:
+    import orjson
+except ImportError:  # optional speedup, stdlib json is the fallback
+    orjson = None
+
+
+def _json_dumps(obj: Any) -> str:
+    if orjson is not None:
+        return orjson.dumps(obj).decode("utf-8")
+    return json.dumps(obj)
+
+
+def _json_loads(raw: str) -> Any:
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+# Word lists for readable run IDs (adjective-animal format).
+# Tuples: indexed slightly faster than lists and immutable at module scope.
+ADJECTIVES = (
     "agile", "bold", "calm", "daring", "eager", "fierce", "gentle", "happy",
     "idle", "jolly", "keen", "lively", "merry", "noble", "proud", "quick",
     "rapid", "serene", "swift", "tame", "unique", "vivid", "warm", "zealous",
     "amber", "azure", "coral", "dusty", "ebony", "frosty", "golden", "hazy",
     "ivory", "jade", "khaki", "lunar", "misty", "navy", "olive", "pearl",
-]
+)
 
-ANIMALS = [
+ANIMALS = (
     "albatross", "badger", "caracal", "dolphin", "eagle", "falcon", "gazelle",
     "heron", "ibis", "jaguar", "koala", "lemur", "meerkat", "narwhal", "otter",
     "panther", "quokka", "raven", "salmon", "toucan", "urchin", "viper", "walrus",
     "barracuda", "cheetah", "dragonfly", "flamingo", "giraffe", "hedgehog",
     "iguana", "jellyfish", "kestrel", "leopard", "mantis", "newt", "octopus",
     "pelican", "quail", "rhino", "starfish", "turtle", "vulture", "wombat",
-]
+)
+
+
+# Private RNG instance: keeps run-id draws off the shared module-level
+# random state that other libraries may seed or contend on.
+_RNG = random.Random()
 
 
 def generate_run_id() -> str:
     """Generate a run ID like 'bold-falcon'."""
-    adj = random.choice(ADJECTIVES)
-    animal = random.choice(ANIMALS)
+    # randrange is the primitive random.choice wraps; indexing directly
+    # skips choice's per-call bounds handling.
+    adj = ADJECTIVES[_RNG.randrange(len(ADJECTIVES))]
+    animal = ANIMALS[_RNG.randrange(len(ANIMALS))]
     return f"{adj}-{animal}"
 
 
 # Supported value types for logging
 SupportedValue = Union[bool, int, float, str, datetime, None]
 
+_SUPPORTED = (bool, int, float, str, datetime, type(None))
+
 
 def is_supported_type(value: Any) -> bool:
     """Check if a value is a directly supported type."""
-    return isinstance(value, (bool, int, float, str, datetime, type(None)))
+    return isinstance(value, _SUPPORTED)
 
 
 def cast_to_string(value: Any) -> str:
@@ -49,49 +76,63 @@ def cast_to_string(value: Any) -> str:
     return str(value)
 
 
+# Exact-type serializer dispatch: one dict lookup instead of an
+# isinstance ladder. Exact types also keep bool (an int subclass) out
+# of the int entry for free.
+_SERIALIZERS = {
+    bool: lambda v: ("bool", "true" if v else "false"),
+    int: lambda v: ("int", str(v)),
+    float: lambda v: ("float", str(v)),
+    str: lambda v: ("str", v),
+    datetime: lambda v: ("datetime", v.isoformat()),
+    type(None): lambda v: ("null", ""),
+}
+
+
 def serialize_value(value: Any) -> tuple[str, str]:
     """Serialize a value for storage, returning (type_tag, serialized_string).
 
     All values are serialized as strings for SQLite TEXT columns.
     """
-    if value is None:
-        return ("null", "")
-    elif isinstance(value, bool):
-        return ("bool", "true" if value else "false")
-    elif isinstance(value, int):
-        return ("int", str(value))
-    elif isinstance(value, float):
-        return ("float", str(value))
-    elif isinstance(value, str):
-        return ("str", value)
-    elif isinstance(value, datetime):
-        return ("datetime", value.isoformat())
-    elif isinstance(value, (set, frozenset)):
-        return ("string_set", json.dumps(sorted(str(v) for v in value)))
-    else:
-        return ("str", str(value))
+    fn = _SERIALIZERS.get(type(value))
+    if fn is not None:
+        return fn(value)
+    if isinstance(value, (set, frozenset)):
+        return ("string_set", _json_dumps(sorted(str(v) for v in value)))
+    # Subclasses miss the exact-type dispatch above; fall through the full
+    # isinstance ladder so e.g. numpy.float64 (a float subclass) still
+    # round-trips as a float rather than a string. bool before int: bool
+    # is an int subclass.
+    for base in (bool, int, float, str, datetime):
+        if isinstance(value, base):
+            return _SERIALIZERS[base](value)
+    return ("str", str(value))
+
+
+def _deserialize_bool(raw: Any) -> bool:
+    if isinstance(raw, str):
+        return raw.lower() == "true"
+    return bool(raw)
+
+
+# Tag-keyed counterpart of _SERIALIZERS; unknown tags pass through raw.
+_DESERIALIZERS = {
+    "null": lambda raw: None,
+    "bool": _deserialize_bool,
+    "int": int,
+    "float": float,
+    "str": str,
+    "datetime": datetime.fromisoformat,
+    "string_set": lambda raw: set(_json_loads(raw)),
+}
 
 
 def deserialize_value(type_tag: str, raw_value: Any) -> Any:
     """Deserialize a value from storage."""
-    if type_tag == "null" or raw_value is None:
+    if raw_value is None:
         return None
-    elif type_tag == "bool":
-        if isinstance(raw_value, str):
-            return raw_value.lower() == "true"
-        return bool(raw_value)
-    elif type_tag == "int":
-        return int(raw_value)
-    elif type_tag == "float":
-        return float(raw_value)
-    elif type_tag == "str":
-        return str(raw_value)
-    elif type_tag == "datetime":
-        return datetime.fromisoformat(raw_value)
-    elif type_tag == "string_set":
-        return set(json.loads(raw_value))
-    else:
-        return raw_value
+    fn = _DESERIALIZERS.get(type_tag)
+    return fn(raw_value) if fn is not None else raw_value
 
 
 def flatten_dict(
@@ -114,39 +155,45 @@ def flatten_dict(
     Raises:
         TypeError: If a value is unsupported and cast_unsupported is False.
     """
+    # Iterative walk: an explicit stack avoids a Python frame per nesting
+    # level, and carrying key parts as tuples defers the string join to
+    # the leaves (one sep.join per key instead of a prefix copy per
+    # level). Each stack entry holds a suspended (key, value) iterator;
+    # descending into a nested container pauses the parent's iteration
+    # and resumes it afterwards, so keys come out in the same in-place
+    # order the recursive version produced. The bool marks list context:
+    # lists convert to indexed keys, and only dict items nest further.
     items: list[tuple[str, SupportedValue]] = []
-
-    for key, value in data.items():
-        new_key = f"{parent_key}{sep}{key}" if parent_key else key
-
-        if isinstance(value, dict):
-            items.extend(
-                flatten_dict(value, new_key, sep, cast_unsupported).items()
-            )
-        elif isinstance(value, (list, tuple)):
-            # Convert lists to indexed keys
-            for i, item in enumerate(value):
-                item_key = f"{new_key}/{i}"
-                if isinstance(item, dict):
-                    items.extend(
-                        flatten_dict(item, item_key, sep, cast_unsupported).items()
-                    )
-                elif is_supported_type(item):
-                    items.append((item_key, item))
-                elif cast_unsupported:
-                    items.append((item_key, cast_to_string(item)))
-                else:
-                    raise TypeError(
-                        f"Unsupported type {type(item).__name__} at {item_key}"
-                    )
-        elif is_supported_type(value):
-            items.append((new_key, value))
-        elif cast_unsupported:
-            items.append((new_key, cast_to_string(value)))
-        else:
-            raise TypeError(
-                f"Unsupported type {type(value).__name__} at {new_key}"
-            )
+    root = (parent_key,) if parent_key else ()
+    stack: list[tuple[tuple[str, ...], Any, bool]] = [
+        (root, iter(data.items()), False)
+    ]
+
+    while stack:
+        parts, current, in_list = stack[-1]
+        descended = False
+        for key, value in current:
+            key_parts = parts + (key,)
+
+            if isinstance(value, dict):
+                stack.append((key_parts, iter(value.items()), False))
+                descended = True
+                break
+            if isinstance(value, (list, tuple)) and not in_list:
+                indexed = ((str(i), item) for i, item in enumerate(value))
+                stack.append((key_parts, indexed, True))
+                descended = True
+                break
+            if isinstance(value, _SUPPORTED):
+                items.append((sep.join(key_parts), value))
+            elif cast_unsupported:
+                items.append((sep.join(key_parts), cast_to_string(value)))
+            else:
+                raise TypeError(
+                    f"Unsupported type {type(value).__name__} at {sep.join(key_parts)}"
+                )
+        if not descended:
+            stack.pop()
 
     return dict(items)
 